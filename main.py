@@ -1,19 +1,37 @@
 # pokedat.py
+from __future__ import annotations
+
 import sys
 import os
 import json
-import argparse
-import multiprocessing
+import functools
+import itertools
+import mmap
 import time
 import logging
 import traceback
-from typing import Callable, Optional
+from types import SimpleNamespace
+from typing import TYPE_CHECKING, Callable, Iterator, Optional
+
+# The pool executors are resolved lazily by concurrent.futures, so single-file
+# runs never pay for importing multiprocessing
+import concurrent.futures
+try:
+    import orjson
+except ImportError:  # Optional speedup, falls back to the stdlib encoder
+    orjson = None
 
-from concurrent.futures import ThreadPoolExecutor, as_completed
 from text_config import TextConfig
-from utilities import get_strings, get_bytes
+from utilities import get_strings, get_bytearray
 from tbl_handler import TblHandler
 
+if TYPE_CHECKING:
+    import argparse
+
+
+# Passed as extra= on "file generated" messages so VerbosityFilter can drop them
+PROGRESS_RECORD = {"is_progress": True}
+
 
 # Configure logging with consistent formatting
 class VerbosityFilter(logging.Filter):
@@ -23,9 +41,14 @@ class VerbosityFilter(logging.Filter):
         
     def filter(self, record):
         # Skip messages about files being generated
-        if not self.allow_generated_messages and any(x in record.msg for x in ["generated at", "writing", "reading"]):
-            return False
-        return True
+        if self.allow_generated_messages:
+            return True
+        return not getattr(record, "is_progress", False)
+
+# ANSI colors for the write summary and error messages
+RED = "\033[91m"
+GREEN = "\033[92m"
+RESET = "\033[0m"
 
 # Configure logging
 logging.basicConfig(
@@ -39,6 +62,164 @@ logger = logging.getLogger(__name__)
 verbosity_filter = VerbosityFilter()
 logger.addFilter(verbosity_filter)
 
+# Per-process TextConfig used by pool workers (set by _worker_init)
+_CONFIG: Optional[TextConfig] = None
+
+
+def _worker_init(version: str) -> None:
+    """Build the TextConfig once per worker process."""
+    global _CONFIG
+    _CONFIG = TextConfig(version)
+
+
+def _worker_run(handler_cls: type, method_name: str, *args):
+    """Run a DatReader/DatWriter/DatMerger method inside a pool worker."""
+    handler = handler_cls(_CONFIG)
+    return getattr(handler, method_name)(*args)
+
+
+def _worker_try(handler_cls: type, method_name: str, *args) -> tuple[object, Optional[Exception]]:
+    """Like _worker_run, but return (result, error) so one failure does not abort executor.map."""
+    try:
+        return _worker_run(handler_cls, method_name, *args), None
+    except Exception as e:
+        return None, e
+
+
+def _map_chunksize(num_items: int, max_workers: int) -> int:
+    """Chunk size for executor.map: about four chunks per worker to amortize IPC."""
+    return max(1, num_items // (max_workers * 4))
+
+_JSON_STRING_ENCODER = json.JSONEncoder(ensure_ascii=False)
+
+
+def _dump_json_string(value: str) -> bytes:
+    """Serialize a single string as a UTF-8 JSON literal."""
+    if orjson is not None:
+        return orjson.dumps(value)
+    return _JSON_STRING_ENCODER.encode(value).encode('utf-8')
+
+def _iter_files(root: str, suffix: str) -> Iterator[str]:
+    """Yield paths of the files under root (recursively) whose names end with suffix."""
+    # An explicit stack avoids a chain of nested generators on deep trees
+    stack = [root]
+    while stack:
+        try:
+            with os.scandir(stack.pop()) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                    elif entry.is_file() and entry.name.endswith(suffix):
+                        yield entry.path
+        except OSError:
+            # Unreadable folders are skipped, as os.walk does
+            continue
+
+def _list_files(root: str, suffix: str) -> list[tuple[str, str, str]]:
+    """List (path, relative path, relative path without extension) of the files under root."""
+    files = []
+    for path in _iter_files(root, suffix):
+        relative = os.path.relpath(path, root)
+        files.append((path, relative, os.path.splitext(relative)[0]))
+    return files
+
+
+def _count_lines(dat_path: str) -> Optional[int]:
+    """Number of lines in a .dat file, or None if it cannot be read (pool worker)."""
+    try:
+        lines = _read_strings(dat_path, _CONFIG)
+    except Exception:
+        return None
+    return len(lines) if lines is not None else None
+
+
+# Per-file progress is logged once every this many files (and for the last one)
+PROGRESS_EVERY = 16
+
+
+def _should_report(idx: int, total: int) -> bool:
+    """Whether the progress line for file idx of total should be logged."""
+    return (idx % PROGRESS_EVERY == 0 or idx == total) and logger.isEnabledFor(logging.INFO)
+
+
+@functools.lru_cache(maxsize=4096)
+def _ensure_dir(path: str) -> None:
+    """Create a folder (and parents) once; later calls for the same path are cache hits."""
+    os.makedirs(path, exist_ok=True)
+
+
+def _ensure_output_dirs(output_folder: str, files: list[tuple[str, str, str]]) -> None:
+    """
+    Create the output folders of all listed files up front, once per distinct folder.
+
+    A folder that cannot be created is only logged; the write of each of its
+    files fails and reports the error as usual, and the other files go ahead.
+    """
+    for folder in {os.path.dirname(relative_no_ext) for _, _, relative_no_ext in files}:
+        path = os.path.join(output_folder, folder) if folder else output_folder
+        try:
+            _ensure_dir(path)
+        except OSError as e:
+            logger.warning("Could not create output folder %s: %s", path, e)
+
+
+# Same file creation as open(path, 'wb'), minus the buffered layer
+_WRITE_FLAGS = (os.O_WRONLY | os.O_CREAT | os.O_TRUNC
+                | getattr(os, "O_BINARY", 0) | getattr(os, "O_CLOEXEC", 0))
+
+
+def _write_file(path: str, data: bytes) -> None:
+    """Write a whole payload to path with direct os.write calls."""
+    fd = os.open(path, _WRITE_FLAGS, 0o666)
+    try:
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view):]
+    finally:
+        os.close(fd)
+
+
+# Text outputs are rendered with "\n" and written with the platform line ending
+_NEWLINE = os.linesep.encode()
+
+
+def _write_text_output(path: str, payload: bytes) -> None:
+    """Write rendered text output to path, creating its folder if needed."""
+    kind = os.path.splitext(path)[1][1:].upper()
+    try:
+        _ensure_dir(os.path.dirname(path))
+        if _NEWLINE != b"\n":
+            payload = payload.replace(b"\n", _NEWLINE)
+        _write_file(path, payload)
+        logger.info("%s generated at %s", kind, path, extra=PROGRESS_RECORD)
+    except Exception as e:
+        logger.error("Error writing %s to %s: %s", kind, path, e)
+
+
+def _read_bytes(file_path: str) -> bytes:
+    """Read a whole file."""
+    with open(file_path, 'rb', buffering=0) as f:
+        return f.read()
+
+
+# Files smaller than this are read directly; mapping them costs more than it saves
+MMAP_MIN_SIZE = 64 * 1024
+
+
+def _read_strings(file_path: str, config: TextConfig) -> list[str] | None:
+    """Decode a .dat file, memory-mapping it when it is large enough to pay off."""
+    with open(file_path, 'rb', buffering=0) as f:
+        if os.fstat(f.fileno()).st_size < MMAP_MIN_SIZE:
+            return get_strings(f.read(), config)
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            return get_strings(data, config)
+
+def _load_json(raw: bytes):
+    """Parse UTF-8 JSON bytes."""
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw.decode('utf-8'))
+
 class PokeDatCLI:
     """Command-line interface for the PokeDAT utility."""
     
@@ -47,150 +228,213 @@ class PokeDatCLI:
         """Displays the program's help message."""
         logger.info("\n=== PokeDAT Switch | by Steins;Traduções ===\n")
         logger.info("Usage:")
-        logger.info("  pokedat.exe <command> <input> [output] --version=<version> [--format=<format>]\n")
+        logger.info("  pokedat.exe <command> <input> [output] --version=<version> [--format=<format>] [--validate]\n")
         logger.info("Commands:")
         logger.info("  read       <file or folder> [output_folder]  -  Extracts texts")
         logger.info("  write      <input_file or folder> <output_folder>  -  Generates .dat files")
         logger.info("  merge      <folder> [output_file]  -  Merges all .dat files from subfolders into single .txt files")
         logger.info("  split      <merged_txt_folder> <output_folder>  -  Splits merged .txt back into .dat files\n")
         logger.info("Supported versions: LGPE, SWSH, LA, SV, LZA")
-        logger.info("Supported formats: json, txt\n")
+        logger.info("Supported formats: json, txt")
+        logger.info("--validate (split): compare line counts against the original .dat files\n")
     
-    @staticmethod
-    def parse_args() -> argparse.Namespace:
+    COMMANDS = ("read", "write", "merge", "split")
+    VERSIONS = ("LGPE", "SWSH", "LA", "SV", "LZA")
+    FORMATS = ("json", "txt")
+
+    @classmethod
+    def parse_args(cls, argv: Optional[list[str]] = None) -> argparse.Namespace | SimpleNamespace:
         """Parse and validate command line arguments."""
+        if argv is None:
+            argv = sys.argv[1:]
+        args = cls._parse_args_fast(argv)
+        if args is not None:
+            return args
+        return cls._parse_args_full(argv)
+
+    @classmethod
+    def _parse_args_fast(cls, argv: list[str]) -> Optional[SimpleNamespace]:
+        """Parse the common `<command> <input> [output] --version=X` form by hand.
+
+        Returns None for anything unusual (help, abbreviations, bad values...)
+        so argparse can handle it and report errors exactly as before.
+        """
+        positionals = []
+        options = {"version": None, "format": "json", "validate": False}
+        tokens = iter(argv)
+        for token in tokens:
+            if not token.startswith("-"):
+                positionals.append(token)
+                continue
+            if token == "--validate":
+                options["validate"] = True
+                continue
+            name, sep, value = token[2:].partition("=")
+            if not token.startswith("--") or name not in ("version", "format"):
+                return None
+            if not sep:
+                value = next(tokens, None)
+                if value is None or value.startswith("-"):
+                    return None
+            options[name] = value
+
+        if not 2 <= len(positionals) <= 3 or positionals[0] not in cls.COMMANDS:
+            return None
+        if options["version"] not in cls.VERSIONS or options["format"] not in cls.FORMATS:
+            return None
+        command, input_path, *rest = positionals
+        return SimpleNamespace(command=command, input=input_path,
+                               output=rest[0] if rest else None, **options)
+
+    @classmethod
+    def _parse_args_full(cls, argv: list[str]) -> argparse.Namespace:
+        """Parse the arguments with argparse, which also prints help and usage errors."""
+        import argparse
+
         parser = argparse.ArgumentParser(
             description="PokeDAT Switch | by Steins;Traduções",
-            usage="pokedat.py {read,write,merge,split} input [output] --version={LGPE,SWSH,LA,SV,LZA} [--format={json,txt}] [-h]\n")
-        parser.add_argument("command", choices=["read", "write", "merge", "split"], help="Command to execute")
+            usage="pokedat.py {read,write,merge,split} input [output] --version={LGPE,SWSH,LA,SV,LZA} [--format={json,txt}] [--validate] [-h]\n")
+        parser.add_argument("command", choices=cls.COMMANDS, help="Command to execute")
         parser.add_argument("input", help="Input file or folder")
         parser.add_argument("output", nargs="?", help="Output folder (optional for 'read')")
-        parser.add_argument("--version", required=True, choices=["LGPE", "SWSH", "LA", "SV", "LZA"],
+        parser.add_argument("--version", required=True, choices=cls.VERSIONS,
                             help="Game version (e.g., LGPE, SWSH, LA, SV, LZA)")
-        parser.add_argument("--format", choices=["json", "txt"], default="json",
+        parser.add_argument("--format", choices=cls.FORMATS, default="json",
                             help="Output/input format (default: json)")
-        return parser.parse_args()
+        parser.add_argument("--validate", action="store_true",
+                            help="For 'split': warn when lines are missing compared to the original .dat files")
+        return parser.parse_args(argv)
 
 
 class DatReader:
     """Handles reading and extracting content from DAT files."""
     
+    # Serializer method for each output format; the format name is also the extension
+    SERIALIZERS = {
+        "json": "serialize_json",
+        "txt": "serialize_txt",
+    }
+    
     def __init__(self, config: TextConfig):
         self.config = config
     
     def read_dat_file(self, file_path: str) -> list[str] | None:
         """Read a .dat file and extract strings."""
         try:
-            with open(file_path, 'rb', buffering=1024 * 1024) as f:
-                data = f.read()
+            lines = _read_strings(file_path, self.config)
         except Exception as e:
-            logger.error(f"Error reading file {file_path}: {e}")
+            logger.error("Error reading file %s: %s", file_path, e)
             return None
 
-        lines = get_strings(data, self.config)
         if lines is None:
-            logger.error(f"Error extracting strings from {file_path}")
+            logger.error("Error extracting strings from %s", file_path)
         return lines
-    def process_file(self, file_path: str, input_root: str, output_folder: Optional[str] = None) -> None:
-        """Process a .dat file and extract its texts to JSON format."""
+    def process_file(self, file_path: str, relative_no_ext: str, output_folder: Optional[str] = None,
+                     fmt: str = "json") -> None:
+        """Process a .dat file and extract its texts in the given format (json or txt)."""
         lines = self.read_dat_file(file_path)
         if not lines:
             return
 
-        # Attempt to load the corresponding .tbl
-        labels = []
-        try:
-            tbl_handler = TblHandler(file_path)
-            labels = tbl_handler.get_labels()
-        except Exception as e:
-            logger.warning(f"Warning: {str(e)}")
-
-        if output_folder:
-            # Prepare JSON data
-            json_data = []
-            for idx, line in enumerate(lines):
-                entry = {
-                    "id": labels[idx]["id"] if idx < len(labels) else f"UNKNOWN_{idx}",
-                    "hash": hex(labels[idx]["hash"]) if idx < len(labels) else "N/A",
-                    "text": line
-                }
-                json_data.append(entry)
-
-            # Define the JSON file path
-            relative = os.path.relpath(file_path, start=input_root)
-            relative_no_ext, _ = os.path.splitext(relative)
-            json_path = os.path.join(output_folder, f"{relative_no_ext}.json")
-            os.makedirs(os.path.dirname(json_path), exist_ok=True)
-
+        if not output_folder:
             try:
-                # Write JSON with UTF-8 encoding
-                with open(json_path, 'w', encoding='utf-8') as f_json:
-                    json.dump(json_data, f_json, ensure_ascii=False, indent=4)
-                # Silent success
+                self.display_lines(file_path, lines)
             except Exception as e:
-                logger.error(f"Error writing JSON to {json_path}: {e}")
-        else:
-            # Display extracted texts
-            logger.info(f"--- {os.path.basename(file_path)} ---")
-            for line in lines:
-                logger.info(f"{line}")
-    def process_file_txt(self, file_path: str, input_root: str, output_folder: Optional[str] = None) -> None:
-        lines = self.read_dat_file(file_path)
-        if not lines:
+                logger.error("Error displaying texts from %s: %s", file_path, e)
             return
 
-        if output_folder:
-            relative = os.path.relpath(file_path, start=input_root)
-            relative_no_ext, _ = os.path.splitext(relative)
-            txt_path = os.path.join(output_folder, f"{relative_no_ext}.txt")
-            os.makedirs(os.path.dirname(txt_path), exist_ok=True)
-
+        try:
+            output_path, payload = self.render_file(file_path, relative_no_ext, output_folder, lines, fmt)
+        except Exception as e:
+            logger.error("Error rendering %s from %s: %s", fmt.upper(), file_path, e)
+            return
+        _write_text_output(output_path, payload)
+    @staticmethod
+    def display_lines(file_path: str, lines: list[str]) -> None:
+        """Print the extracted texts with a single write instead of one log record per line."""
+        if not logger.isEnabledFor(logging.INFO):
+            return
+        sys.stdout.write(f"--- {os.path.basename(file_path)} ---\n" + "\n".join(lines) + "\n")
+        sys.stdout.flush()
+    def render_file(self, file_path: str, relative_no_ext: str, output_folder: str, lines: list[str],
+                    fmt: str = "json") -> tuple[str, bytes]:
+        """Render the lines of a .dat file in the given format, returning the output path and its contents."""
+        serialize = getattr(self, self.SERIALIZERS[fmt])
+        output_path = os.path.join(output_folder, f"{relative_no_ext}.{fmt}")
+        return output_path, serialize(file_path, lines)
+    def serialize_json(self, file_path: str, lines: list[str]) -> bytes:
+        """Serialize lines as JSON entries labelled from the .tbl next to file_path."""
+        # Load the corresponding .tbl, if there is one
+        labels = ()
+        if os.path.exists(TblHandler.get_tbl_path(file_path)):
             try:
-                with open(txt_path, 'w', encoding='utf-8') as f_txt:
-                    for line in lines:
-                        f_txt.write(f"{line}\n")
-                logger.info(f"TXT generated at {txt_path}")
+                labels = TblHandler(file_path).get_label_pairs()
             except Exception as e:
-                logger.error(f"Error writing TXT to {txt_path}: {e}")
-        else:
-            logger.info(f"--- {os.path.basename(file_path)} ---")
-            for line in lines:
-                logger.info(f"{line}")
+                logger.warning("Warning: %s", e)
+
+        # Encode entry by entry, matching json.dump(..., indent=4) output.
+        # Hashes and UNKNOWN_n ids never need escaping, so they are formatted directly
+        dump = _dump_json_string
+        labels = labels[:len(lines)]
+        ids = [dump(entry_id) for entry_id, _ in labels]
+        ids += [b'"UNKNOWN_%d"' % idx for idx in range(len(labels), len(lines))]
+        hashes = [b'"0x%x"' % label_hash for _, label_hash in labels]
+        hashes += [b'"N/A"'] * (len(lines) - len(labels))
+        entries = [b'    {\n        "id": ' + entry_id
+                   + b',\n        "hash": ' + entry_hash
+                   + b',\n        "text": ' + dump(line)
+                   + b'\n    }'
+                   for entry_id, entry_hash, line in zip(ids, hashes, lines)]
+        return b"[\n" + b",\n".join(entries) + b"\n]"
+    def serialize_txt(self, file_path: str, lines: list[str]) -> bytes:
+        """Serialize lines as plain text, one per line."""
+        return ('\n'.join(lines) + '\n').encode('utf-8')
     def process_directory(self, input_folder: str, output_folder: Optional[str] = None,
-                        max_workers: Optional[int] = None,
-                        process_func: Optional[Callable[[str, str, Optional[str]], None]] = None) -> None:
-
-        if process_func is None:
-            process_func = self.process_file
+                        max_workers: Optional[int] = None, fmt: str = "json") -> None:
 
         if not os.path.isdir(input_folder):
             logger.error(f"Folder not found: {input_folder}")
             sys.exit(1)
 
-        files = [os.path.join(root, name)
-                for root, _, filenames in os.walk(input_folder)
-                for name in filenames if name.endswith('.dat')]
+        # Output paths and status lines are derived from these, so compute them once here
+        files = _list_files(input_folder, '.dat')
 
         if not files:
             logger.warning(f"No .dat files found in {input_folder} or subfolders")
             return
 
-        # Dynamically adjust max_workers
-        max_workers = min(max_workers or (multiprocessing.cpu_count() * 2), len(files))
+        if len(files) == 1:
+            # A single file is not worth starting a worker pool for
+            file, relative, relative_no_ext = files[0]
+            self.process_file(file, relative_no_ext, output_folder, fmt)
+            if _should_report(1, 1):
+                logger.info("[%d/%d] Processed: %s", 1, 1, relative)
+            return
+
+        # Parsing is CPU-bound, so one worker process per core
+        max_workers = min(max_workers or (os.cpu_count() or 1), len(files))
+
+        if output_folder:
+            _ensure_output_dirs(output_folder, files)
 
         logger.info(f"Starting processing of {len(files)} files with {max_workers} workers")
         start_time = time.perf_counter()
         
-        with ThreadPoolExecutor(max_workers=max_workers) as executor:
-            futures = {executor.submit(process_func, file, input_folder, output_folder): file for file in files}
-            for idx, future in enumerate(as_completed(futures), start=1):
-                try:
-                    future.result()
-                    # Show status with relative path
-                    rel_path = os.path.relpath(futures[future], start=input_folder)
-                    logger.info(f"[{idx}/{len(files)}] Processed: {rel_path}")
-                except Exception as e:
-                    logger.error(f"Error during processing {futures[future]}: {e}")
+        # Each worker decodes, renders and writes its own files, so only the
+        # small (result, error) pairs cross the process boundary
+        with concurrent.futures.ProcessPoolExecutor(max_workers=max_workers, initializer=_worker_init,
+                                 initargs=(self.config.game_version,)) as executor:
+            file_paths, rel_paths, rel_stems = zip(*files)
+            results = executor.map(_worker_try, itertools.repeat(DatReader), itertools.repeat("process_file"),
+                                   file_paths, rel_stems, itertools.repeat(output_folder), itertools.repeat(fmt),
+                                   chunksize=_map_chunksize(len(files), max_workers))
+            for idx, (file, relative, (_, error)) in enumerate(zip(file_paths, rel_paths, results), start=1):
+                if error is not None:
+                    logger.error("Error during processing %s: %s", file, error)
+                    continue
+                # Show status with relative path, every PROGRESS_EVERY files
+                if _should_report(idx, len(files)):
+                    logger.info("[%d/%d] Processed: %s", idx, len(files), relative)
 
         elapsed_time = time.perf_counter() - start_time
         files_per_second = len(files) / elapsed_time if elapsed_time > 0 else 0
@@ -206,106 +450,138 @@ class DatWriter:
         self.error_count = 0
         self.error_files = []
     
-    def process_file_json(self, json_path: str, input_root: str, output_folder: str) -> bool:
+    def process_file_json(self, json_path: str, relative_no_ext: str, output_folder: str) -> bool:
         """Process a JSON file and generate the corresponding .dat file."""
         output_path = None
         try:
-            with open(json_path, 'r', encoding='utf-8', buffering=1024*1024) as f:
-                json_data = json.load(f)
-        except json.JSONDecodeError as e:
-            logger.error(f"\033[91m✗ JSON PARSE ERROR in {json_path}:\n    Line {e.lineno}, Column {e.colno}: {e.msg}\033[0m")
+            json_data = _load_json(_read_bytes(json_path))
+        except json.JSONDecodeError as e:  # Also covers orjson.JSONDecodeError
+            logger.error(RED + "✗ JSON PARSE ERROR in %s:\n    Line %d, Column %d: %s" + RESET,
+                         json_path, e.lineno, e.colno, e.msg)
             return False
         except Exception as e:
-            logger.error(f"\033[91m✗ ERROR reading JSON {json_path}: {e}\033[0m")
+            logger.error(RED + "✗ ERROR reading JSON %s: %s" + RESET, json_path, e)
             return False
 
         try:
-            lines = []
-            for idx, entry in enumerate(json_data):
-                if not isinstance(entry, dict):
-                    logger.error(f"\033[91m✗ ERROR in {json_path}:\n    Entry #{idx} is not a valid object (expected dict, got {type(entry).__name__})\033[0m")
-                    return False
-                if "text" not in entry:
-                    logger.error(f"\033[91m✗ ERROR in {json_path}:\n    Entry #{idx} missing 'text' field. Available fields: {list(entry.keys())}\033[0m")
-                    return False
-                lines.append(entry["text"])
+            try:
+                lines = [entry["text"] for entry in json_data]
+            except (TypeError, KeyError):
+                # Walk the entries again only to pinpoint the invalid one
+                for idx, entry in enumerate(json_data):
+                    if not isinstance(entry, dict):
+                        logger.error(RED + "✗ ERROR in %s:\n    Entry #%d is not a valid object (expected dict, got %s)" + RESET,
+                                     json_path, idx, type(entry).__name__)
+                        return False
+                    if "text" not in entry:
+                        logger.error(RED + "✗ ERROR in %s:\n    Entry #%d missing 'text' field. Available fields: %s" + RESET,
+                                     json_path, idx, list(entry.keys()))
+                        return False
+                raise
             
-            flags = [0] * len(lines)
+            flags = itertools.repeat(0, len(lines))
             try:
-                data = get_bytes(lines, flags, self.config)
+                data = get_bytearray(lines, flags, self.config)
             except Exception as e:
-                logger.error(f"\033[91m✗ ERROR converting text to bytes in {json_path}:\n    {type(e).__name__}: {e}\n    Total entries: {len(lines)}\033[0m")
+                logger.error(RED + "✗ ERROR converting text to bytes in %s:\n    %s: %s\n    Total entries: %d" + RESET,
+                             json_path, type(e).__name__, e, len(lines))
                 return False
 
-            relative = os.path.relpath(json_path, start=input_root)
-            relative_no_ext, _ = os.path.splitext(relative)
             output_path = os.path.join(output_folder, f"{relative_no_ext}.dat")
-            os.makedirs(os.path.dirname(output_path), exist_ok=True)
+            _ensure_dir(os.path.dirname(output_path))
 
-            with open(output_path, 'wb', buffering=1024*1024) as f:
-                f.write(data)
-            logger.info(f"File {os.path.basename(output_path)} generated at {output_path}")
+            _write_file(output_path, data)
+            logger.info("File %s generated at %s", os.path.basename(output_path), output_path,
+                        extra=PROGRESS_RECORD)
             return True
         except KeyError as e:
             location = f" to {output_path}" if output_path else f" in {json_path}"
-            logger.error(f"\033[91m✗ KEY ERROR writing .dat{location}:\n    Missing key: {e}\033[0m")
+            logger.error(RED + "✗ KEY ERROR writing .dat%s:\n    Missing key: %s" + RESET, location, e)
             return False
         except Exception as e:
             location = f" to {output_path}" if output_path else f" from {json_path}"
             tb = traceback.format_exc()
-            logger.error(f"\033[91m✗ ERROR writing .dat{location}:\n    {type(e).__name__}: {e}\n\nTraceback:\n{tb}\033[0m")
+            logger.error(RED + "✗ ERROR writing .dat%s:\n    %s: %s\n\nTraceback:\n%s" + RESET,
+                         location, type(e).__name__, e, tb)
             return False
     
-    def process_file_txt(self, txt_path: str, input_root: str, output_folder: str) -> bool:
+    def process_file_txt(self, txt_path: str, relative_no_ext: str, output_folder: str) -> bool:
         """Process a TXT file and generate the corresponding .dat file."""
         output_path = None
         try:
-            with open(txt_path, 'r', encoding='utf-8', buffering=1024*1024) as f:
-                lines = [line.strip() for line in f if line.strip()]
+            text = _read_bytes(txt_path).decode('utf-8')
+            # Same line breaks as text mode; str.splitlines() would also split on \x85, \u2028, ...
+            if '\r' in text:
+                text = text.replace('\r\n', '\n').replace('\r', '\n')
+            lines = [line for line in map(str.strip, text.split('\n')) if line]
         except UnicodeDecodeError as e:
-            logger.error(f"\033[91m✗ ENCODING ERROR in {txt_path}:\n    Position {e.start}-{e.end}: {e.reason}\033[0m")
+            logger.error(RED + "✗ ENCODING ERROR in %s:\n    Position %d-%d: %s" + RESET,
+                         txt_path, e.start, e.end, e.reason)
             return False
         except Exception as e:
-            logger.error(f"\033[91m✗ ERROR reading TXT {txt_path}:\n    {type(e).__name__}: {e}\033[0m")
+            logger.error(RED + "✗ ERROR reading TXT %s:\n    %s: %s" + RESET, txt_path, type(e).__name__, e)
             return False
 
         try:
-            flags = [0] * len(lines)
+            flags = itertools.repeat(0, len(lines))
             try:
-                data = get_bytes(lines, flags, self.config)
+                data = get_bytearray(lines, flags, self.config)
             except Exception as e:
-                logger.error(f"\033[91m✗ ERROR converting text to bytes in {txt_path}:\n    {type(e).__name__}: {e}\n    Total lines: {len(lines)}\033[0m")
+                logger.error(RED + "✗ ERROR converting text to bytes in %s:\n    %s: %s\n    Total lines: %d" + RESET,
+                             txt_path, type(e).__name__, e, len(lines))
                 return False
 
-            relative = os.path.relpath(txt_path, start=input_root)
-            relative_no_ext, _ = os.path.splitext(relative)
             output_path = os.path.join(output_folder, f"{relative_no_ext}.dat")
-            os.makedirs(os.path.dirname(output_path), exist_ok=True)
+            _ensure_dir(os.path.dirname(output_path))
 
-            with open(output_path, 'wb', buffering=1024*1024) as f:
-                f.write(data)
-            logger.info(f"File {os.path.basename(output_path)} generated at {output_path}")
+            _write_file(output_path, data)
+            logger.info("File %s generated at %s", os.path.basename(output_path), output_path,
+                        extra=PROGRESS_RECORD)
             return True
         except Exception as e:
             location = f" to {output_path}" if output_path else f" from {txt_path}"
             tb = traceback.format_exc()
-            logger.error(f"\033[91m✗ ERROR writing .dat{location}:\n    {type(e).__name__}: {e}\n\nTraceback:\n{tb}\033[0m")
+            logger.error(RED + "✗ ERROR writing .dat%s:\n    %s: %s\n\nTraceback:\n%s" + RESET,
+                         location, type(e).__name__, e, tb)
             return False
     
+    def _iter_results(self, files: list[tuple[str, str, str]], output_folder: str, max_workers: int,
+                      process_func: Callable[[str, str, str], bool]) -> Iterator[tuple[object, Optional[Exception]]]:
+        """Yield (result, error) for each file, in order, using a worker pool unless there is only one."""
+        if len(files) == 1:
+            # A single file is not worth starting a worker pool for
+            file, _, relative_no_ext = files[0]
+            try:
+                yield process_func(file, relative_no_ext, output_folder), None
+            except Exception as e:
+                yield None, e
+            return
+
+        file_paths, _, rel_stems = zip(*files)
+        with concurrent.futures.ProcessPoolExecutor(max_workers=max_workers, initializer=_worker_init,
+                                 initargs=(self.config.game_version,)) as executor:
+            yield from executor.map(_worker_try, itertools.repeat(type(self)),
+                                    itertools.repeat(process_func.__name__), file_paths, rel_stems,
+                                    itertools.repeat(output_folder),
+                                    chunksize=_map_chunksize(len(files), max_workers))
+
     def process_directory(self, input_folder: str, output_folder: str,
                         max_workers: Optional[int] = None, file_pattern="*.json",
                         process_func: Optional[Callable[[str, str, str], bool]] = None) -> None:
-        """Process all input files in a directory with multithreading."""
+        """Process all input files in a directory with a pool of worker processes."""
         if process_func is None:
             process_func = self.process_file_json
+        # Pool workers run the method of the same name on their own DatWriter
+        if process_func not in (self.process_file_json, self.process_file_txt):
+            raise ValueError(f"process_func must be process_file_json or process_file_txt, got {process_func!r}")
 
         if not os.path.isdir(input_folder):
             logger.error(f"Input folder not found: {input_folder}")
             sys.exit(1)
 
-        files = [os.path.join(root, name)
-                for root, _, filenames in os.walk(input_folder)
-                for name in filenames if name.endswith(file_pattern[1:])]
+        # "*.json" -> ".json"; also accepts a bare suffix
+        suffix = file_pattern.lstrip('*')
+        files = _list_files(input_folder, suffix)
 
         if not files:
             logger.warning(f"No {file_pattern} files found in {input_folder} or subfolders")
@@ -316,31 +592,31 @@ class DatWriter:
         self.error_count = 0
         self.error_files = []
 
-        # Dynamically adjust max_workers
-        max_workers = min(max_workers or (multiprocessing.cpu_count() * 2), len(files))
+        # Encoding is CPU-bound, so one worker process per core
+        max_workers = min(max_workers or (os.cpu_count() or 1), len(files))
 
         logger.info(f"Starting processing of {len(files)} files with {max_workers} workers")
         start_time = time.perf_counter()
         
-        with ThreadPoolExecutor(max_workers=max_workers) as executor:
-            futures = {executor.submit(process_func, file, input_folder, output_folder): file for file in files}
-            for idx, future in enumerate(as_completed(futures), start=1):
-                file_path = futures[future]
-                rel_path = os.path.relpath(file_path, start=input_folder)
-                try:
-                    success = future.result()
-                    if success:
-                        self.success_count += 1
-                        logger.info(f"[{idx}/{len(files)}] ✓ Processed: {rel_path}")
-                    else:
-                        # Error details already logged in process_file_* methods
-                        self.error_count += 1
-                        self.error_files.append(rel_path)
-                except Exception as e:
-                    # Unexpected exception not caught by process_file_* methods
-                    self.error_count += 1
-                    self.error_files.append(rel_path)
-                    logger.error(f"\033[91m[{idx}/{len(files)}] ✗ UNEXPECTED ERROR processing {rel_path}:\n    {type(e).__name__}: {e}\033[0m")
+        # Create output folders once here; forked workers inherit the warmed cache
+        _ensure_output_dirs(output_folder, files)
+        rel_paths = [relative for _, relative, _ in files]
+        results = self._iter_results(files, output_folder, max_workers, process_func)
+        for idx, (rel_path, (success, error)) in enumerate(zip(rel_paths, results), start=1):
+            if error is not None:
+                # Unexpected exception not caught by process_file_* methods
+                self.error_count += 1
+                self.error_files.append(rel_path)
+                logger.error(RED + "[%d/%d] ✗ UNEXPECTED ERROR processing %s:\n    %s: %s" + RESET,
+                             idx, len(files), rel_path, type(error).__name__, error)
+            elif success:
+                self.success_count += 1
+                if _should_report(idx, len(files)):
+                    logger.info("[%d/%d] ✓ Processed: %s", idx, len(files), rel_path)
+            else:
+                # Error details already logged in process_file_* methods
+                self.error_count += 1
+                self.error_files.append(rel_path)
 
         elapsed_time = time.perf_counter() - start_time
         files_per_second = len(files) / elapsed_time if elapsed_time > 0 else 0
@@ -350,14 +626,14 @@ class DatWriter:
         logger.info("COMPILATION SUMMARY")
         logger.info("="*60)
         logger.info(f"Total files: {len(files)}")
-        logger.info(f"\033[92m✓ Successful: {self.success_count}\033[0m")
+        logger.info(GREEN + "✓ Successful: %d" + RESET, self.success_count)
         if self.error_count > 0:
-            logger.error(f"\033[91m✗ Failed: {self.error_count}\033[0m")
+            logger.error(RED + "✗ Failed: %d" + RESET, self.error_count)
             logger.error("\nFailed files:")
             for error_file in self.error_files:
-                logger.error(f"\033[91m  - {error_file}\033[0m")
+                logger.error(RED + "  - %s" + RESET, error_file)
         else:
-            logger.info("\033[92m✓ All files compiled successfully!\033[0m")
+            logger.info(GREEN + "✓ All files compiled successfully!" + RESET)
         logger.info(f"\nTime: {elapsed_time:.2f} seconds ({files_per_second:.2f} files/sec)")
         logger.info("="*60 + "\n")
 
@@ -381,39 +657,41 @@ class DatMerger:
             logger.warning(f"No .dat files found in {folder_path}")
             return
         
-        logger.info(f"Merging {len(dat_files)} files from {os.path.basename(folder_path)}...")
+        # Folders are merged in parallel, so every per-file message names its folder
+        folder_name = os.path.basename(folder_path)
+        logger.info(f"Merging {len(dat_files)} files from {folder_name}...")
         
         try:
-            os.makedirs(os.path.dirname(output_file), exist_ok=True)
-            with open(output_file, 'w', encoding='utf-8') as out_f:
+            _ensure_dir(os.path.dirname(output_file))
+            with open(output_file, 'w', encoding='utf-8', buffering=4 * 1024 * 1024) as out_f, \
+                    concurrent.futures.ThreadPoolExecutor(max_workers=1) as prefetcher:
+                # Keep the next file's read in flight while the current one is decoded
+                next_data = prefetcher.submit(_read_bytes, os.path.join(folder_path, dat_files[0]))
                 for idx, dat_file in enumerate(dat_files, 1):
-                    dat_path = os.path.join(folder_path, dat_file)
+                    data = next_data
+                    if idx < len(dat_files):
+                        next_data = prefetcher.submit(_read_bytes, os.path.join(folder_path, dat_files[idx]))
                     
                     # Read .dat file
                     try:
-                        with open(dat_path, 'rb') as f:
-                            data = f.read()
-                        lines = get_strings(data, self.config)
+                        lines = get_strings(data.result(), self.config)
                         
                         if lines is None:
-                            logger.warning(f"Could not extract strings from {dat_file}")
+                            logger.warning("Could not extract strings from %s/%s", folder_name, dat_file)
                             continue
                         
-                        # Write separator and filename
-                        out_f.write(f"{dat_file} {self.separator}\n")
-                        
-                        # Write all lines
-                        for line in lines:
-                            out_f.write(f"{line}\n")
-                        
-                        # Add blank line between files (except last)
+                        # Separator and filename, all lines, then a blank line between files (except last)
+                        chunk = f"{dat_file} {self.separator}\n"
+                        if lines:
+                            chunk += '\n'.join(lines) + '\n'
                         if idx < len(dat_files):
-                            out_f.write("\n")
+                            chunk += '\n'
+                        out_f.write(chunk)
                         
-                        logger.info(f"  [{idx}/{len(dat_files)}] Merged: {dat_file}")
+                        logger.info("  [%d/%d] Merged: %s/%s", idx, len(dat_files), folder_name, dat_file)
                         
                     except Exception as e:
-                        logger.error(f"Error processing {dat_file}: {e}")
+                        logger.error("Error processing %s/%s: %s", folder_name, dat_file, e)
                         continue
             
             logger.info(f"✓ Merged file created: {output_file}\n")
@@ -441,61 +719,84 @@ class DatMerger:
         
         logger.info(f"Found {len(subfolders)} folder(s): {', '.join(subfolders)}\n")
         
-        for subfolder in subfolders:
-            folder_path = os.path.join(input_folder, subfolder)
-            output_file = os.path.join(output_folder, f"{subfolder}.txt")
-            self.merge_folder(folder_path, output_file)
+        if len(subfolders) == 1:
+            # A single folder is not worth starting a worker pool for
+            self.merge_folder(os.path.join(input_folder, subfolders[0]),
+                              os.path.join(output_folder, f"{subfolders[0]}.txt"))
+            return
+
+        # Each subfolder is merged independently, one worker process per folder
+        folder_paths = [os.path.join(input_folder, subfolder) for subfolder in subfolders]
+        output_files = [os.path.join(output_folder, f"{subfolder}.txt") for subfolder in subfolders]
+        max_workers = min(os.cpu_count() or 1, len(subfolders))
+        with concurrent.futures.ProcessPoolExecutor(max_workers=max_workers, initializer=_worker_init,
+                                 initargs=(self.config.game_version,)) as executor:
+            list(executor.map(_worker_run, itertools.repeat(DatMerger), itertools.repeat("merge_folder"),
+                              folder_paths, output_files))
 
 
 class DatSplitter:
     """Handles splitting merged text files back into individual .dat files."""
     
-    def __init__(self, config: TextConfig):
+    def __init__(self, config: TextConfig, validate: bool = False):
         self.config = config
+        self.validate = validate
         self.separator_prefix = "~" * 50
         self.original_line_counts = {}
     
+    def count_original_lines(self, merged_txt: str, subfolder_name: str, filenames) -> dict[str, int]:
+        """Count the lines of each original .dat file in parallel, keyed by filename."""
+        originals_dir = os.path.dirname(merged_txt).replace(os.path.basename(os.path.dirname(merged_txt)), subfolder_name)
+        originals = {filename: os.path.join(originals_dir, filename) for filename in filenames}
+        originals = {filename: path for filename, path in originals.items() if os.path.exists(path)}
+        if not originals:
+            return {}
+        
+        max_workers = min(os.cpu_count() or 1, len(originals))
+        with concurrent.futures.ProcessPoolExecutor(max_workers=max_workers, initializer=_worker_init,
+                                 initargs=(self.config.game_version,)) as executor:
+            counts = executor.map(_count_lines, originals.values())
+            return {filename: count for filename, count in zip(originals, counts) if count is not None}
+    
     def split_file(self, merged_txt: str, output_folder: str) -> None:
         """Split a merged text file back into individual .dat files."""
         if not os.path.isfile(merged_txt):
             logger.error(f"File not found: {merged_txt}")
             return
         
-        try:
-            with open(merged_txt, 'r', encoding='utf-8') as f:
-                content = f.read()
-        except Exception as e:
-            logger.error(f"Error reading {merged_txt}: {e}")
-            return
-        
         # Determine subfolder name from filename (e.g., "common.txt" -> "common")
         base_name = os.path.basename(merged_txt)
         subfolder_name = os.path.splitext(base_name)[0]
         
-        output_subfolder = os.path.join(output_folder, subfolder_name)
-        os.makedirs(output_subfolder, exist_ok=True)
-        
-        # Split content by separator
+        # Split content by separator, streaming the file line by line
+        sep = self.separator_prefix
         files_data = {}
         current_file = None
         current_lines = []
         
-        for line in content.split('\n'):
-            # Check if line is a separator (ends with ~~~)
-            if self.separator_prefix in line and line.endswith(self.separator_prefix):
-                # Save previous file if exists
-                if current_file and current_lines:
-                    files_data[current_file] = current_lines
-                
-                # Extract filename from separator line (format: "filename.dat ~~~")
-                parts = line.split(self.separator_prefix)
-                if len(parts) > 0:
-                    current_file = parts[0].strip()
-                    current_lines = []
-            elif current_file is not None:
-                # Add line to current file (skip empty separator lines)
-                if line or current_lines:  # Keep line if it's not empty or if we already have content
-                    current_lines.append(line)
+        try:
+            with open(merged_txt, 'r', encoding='utf-8', buffering=1024 * 1024) as f:
+                for raw in f:
+                    line = raw.rstrip('\n')
+                    # Check if line is a separator (ends with ~~~)
+                    if line.endswith(sep):
+                        # Save previous file if exists
+                        if current_file and current_lines:
+                            files_data[current_file] = current_lines
+                        
+                        # Extract filename from separator line (format: "filename.dat ~~~")
+                        current_file = line[:line.index(sep)].strip()
+                        current_lines = []
+                    elif current_file is not None:
+                        # Add line to current file (skip empty separator lines)
+                        if line or current_lines:  # Keep line if it's not empty or if we already have content
+                            current_lines.append(line)
+        except Exception as e:
+            logger.error(f"Error reading {merged_txt}: {e}")
+            return
+        
+        output_subfolder = os.path.join(output_folder, subfolder_name)
+        _ensure_dir(output_subfolder)
         
         # Save last file
         if current_file and current_lines:
@@ -510,6 +811,10 @@ class DatSplitter:
         
         logger.info(f"Splitting {len(files_data)} files to {subfolder_name}/...\n")
         
+        self.original_line_counts = {}
+        if self.validate:
+            self.original_line_counts = self.count_original_lines(merged_txt, subfolder_name, files_data)
+        
         success_count = 0
         error_count = 0
         warnings = []
@@ -522,37 +827,29 @@ class DatSplitter:
                     lines.pop()
                 
                 if not lines:
-                    logger.warning(f"  [{idx}/{len(files_data)}] Skipping {filename} (no content)")
+                    logger.warning("  [%d/%d] Skipping %s (no content)", idx, len(files_data), filename)
                     continue
                 
-                # Check if original file exists to compare line count
-                original_file = os.path.join(os.path.dirname(merged_txt).replace(os.path.basename(os.path.dirname(merged_txt)), subfolder_name), filename)
-                if os.path.exists(original_file):
-                    try:
-                        with open(original_file, 'rb') as f:
-                            original_data = f.read()
-                        original_lines = get_strings(original_data, self.config)
-                        if original_lines and len(lines) < len(original_lines):
-                            diff = len(original_lines) - len(lines)
-                            warning_msg = f"{filename}: FALTANDO {diff} linha(s) (original: {len(original_lines)}, atual: {len(lines)})"
-                            warnings.append(warning_msg)
-                            logger.warning(f"  ⚠ {warning_msg}")
-                    except:
-                        pass  # If cannot read original, just continue
+                # Compare line count with the original file, if it was counted
+                original_count = self.original_line_counts.get(filename)
+                if original_count and len(lines) < original_count:
+                    diff = original_count - len(lines)
+                    warning_msg = f"{filename}: FALTANDO {diff} linha(s) (original: {original_count}, atual: {len(lines)})"
+                    warnings.append(warning_msg)
+                    logger.warning("  ⚠ %s", warning_msg)
                 
                 # Generate .dat file
-                flags = [0] * len(lines)
-                data = get_bytes(lines, flags, self.config)
+                flags = itertools.repeat(0, len(lines))
+                data = get_bytearray(lines, flags, self.config)
                 
                 output_path = os.path.join(output_subfolder, filename)
-                with open(output_path, 'wb') as f:
-                    f.write(data)
+                _write_file(output_path, data)
                 
-                logger.info(f"  [{idx}/{len(files_data)}] ✓ Created: {filename}")
+                logger.info("  [%d/%d] ✓ Created: %s", idx, len(files_data), filename)
                 success_count += 1
                 
             except Exception as e:
-                logger.error(f"  [{idx}/{len(files_data)}] ✗ Error creating {filename}: {e}")
+                logger.error("  [%d/%d] ✗ Error creating %s: %s", idx, len(files_data), filename, e)
                 error_count += 1
         
         logger.info(f"\n✓ Split complete: {success_count} files created")
@@ -561,7 +858,7 @@ class DatSplitter:
         if warnings:
             logger.warning(f"\n⚠ AVISOS: {len(warnings)} arquivo(s) com linhas faltando:")
             for warning in warnings:
-                logger.warning(f"  - {warning}")
+                logger.warning("  - %s", warning)
         logger.info("")
     
     def process_directory(self, input_folder: str, output_folder: str) -> None:
@@ -599,17 +896,12 @@ class DatSplitter:
 
 def run_read(args: argparse.Namespace, config: TextConfig) -> None:
     reader = DatReader(config)
-    read_format_map = {
-        "json": reader.process_file,
-        "txt": reader.process_file_txt,
-    }
-    process_func = read_format_map[args.format]
 
     if os.path.isdir(args.input):
-        reader.process_directory(args.input, args.output, process_func=process_func)
+        reader.process_directory(args.input, args.output, fmt=args.format)
     else:
-        input_root = os.path.dirname(args.input)
-        process_func(args.input, input_root, args.output)
+        relative_no_ext, _ = os.path.splitext(os.path.basename(args.input))
+        reader.process_file(args.input, relative_no_ext, args.output, args.format)
 
 
 def run_write(args: argparse.Namespace, config: TextConfig) -> None:
@@ -628,8 +920,8 @@ def run_write(args: argparse.Namespace, config: TextConfig) -> None:
         writer.process_directory(args.input, args.output,
                             file_pattern=file_pattern, process_func=process_func)
     else:
-        input_root = os.path.dirname(args.input)
-        process_func(args.input, input_root, args.output)
+        relative_no_ext, _ = os.path.splitext(os.path.basename(args.input))
+        process_func(args.input, relative_no_ext, args.output)
 
 
 def run_merge(args: argparse.Namespace, config: TextConfig) -> None:
@@ -644,7 +936,7 @@ def run_split(args: argparse.Namespace, config: TextConfig) -> None:
         logger.error("Missing output path for 'split' command.")
         sys.exit(1)
     
-    splitter = DatSplitter(config)
+    splitter = DatSplitter(config, validate=args.validate)
     
     if os.path.isfile(args.input):
         # Single file
@@ -670,4 +962,8 @@ def main() -> None:
 
 
 if __name__ == "__main__":
+    if getattr(sys, "frozen", False):
+        # Only frozen (PyInstaller) builds need this for the pool workers to start
+        import multiprocessing
+        multiprocessing.freeze_support()
     main()
\ No newline at end of file
@@ -1,7 +1,12 @@
 # tbl_handler.py
+import functools
 import struct
 import os
-from typing import BinaryIO, List, Dict, Any
+from typing import BinaryIO, List, Dict, Any, Tuple
+
+# Precompiled formats: magic / entry count, and entry header (label hash, name length)
+U32 = struct.Struct("<I")
+ENTRY_HEADER = struct.Struct("<QH")
 
 
 class TblHandler:
@@ -17,12 +22,11 @@ class TblHandler:
         Args:
             dat_path: Path to the .dat file. The .tbl file path is derived from this.
         """
-        self.tbl_path = self._get_tbl_path(dat_path)
-        self.labels: List[Dict[str, Any]] = []
-        self._load_tbl()
+        self.tbl_path = self.get_tbl_path(dat_path)
+        self._label_pairs = self._load_tbl()
     
     @staticmethod
-    def _get_tbl_path(dat_path: str) -> str:
+    def get_tbl_path(dat_path: str) -> str:
         """
         Convert a .dat file path to its corresponding .tbl file path.
         
@@ -34,10 +38,13 @@ class TblHandler:
         """
         return os.path.splitext(dat_path)[0] + ".tbl"
         
-    def _load_tbl(self) -> None:
+    def _load_tbl(self) -> Tuple[Tuple[str, int], ...]:
         """
         Load label information from the .tbl file.
         
+        Returns:
+            Tuple of (id, hash) pairs, shared with other handlers of the same .tbl
+            
         Raises:
             FileNotFoundError: If the .tbl file doesn't exist
             ValueError: If the .tbl file has an invalid header
@@ -45,11 +52,10 @@ class TblHandler:
         if not os.path.exists(self.tbl_path):
             raise FileNotFoundError(f".tbl file not found: {self.tbl_path}")
         
-        with open(self.tbl_path, "rb") as f:
-            self._validate_header(f)
-            self._read_entries(f)
+        return _load_labels(self.tbl_path)
     
-    def _validate_header(self, file_handle: BinaryIO) -> None:
+    @classmethod
+    def _validate_header(cls, file_handle: BinaryIO) -> None:
         """
         Validate the .tbl file header.
         
@@ -59,24 +65,36 @@ class TblHandler:
         Raises:
             ValueError: If the header is invalid
         """
-        magic = struct.unpack("<I", file_handle.read(4))[0]
-        if magic != self.MAGIC:
+        magic = U32.unpack(file_handle.read(U32.size))[0]
+        if magic != cls.MAGIC:
             raise ValueError("Invalid .tbl header!")
     
-    def _read_entries(self, file_handle: BinaryIO) -> None:
+    @classmethod
+    def _read_entries(cls, file_handle: BinaryIO) -> List[Tuple[str, int]]:
         """
         Read all label entries from the .tbl file.
         
         Args:
             file_handle: Open file handle for the .tbl file
+            
+        Returns:
+            List of (id, hash) pairs
         """
-        num_entries = struct.unpack("<I", file_handle.read(4))[0]
+        entries = []
+        num_entries = U32.unpack(file_handle.read(U32.size))[0]
+        # Read the rest of the table at once and walk it in memory
+        buf = file_handle.read()
+        unpack_header = ENTRY_HEADER.unpack_from
+        header_size = ENTRY_HEADER.size
+        encoding = cls.ENCODING
+        offset = 0
         for _ in range(num_entries):
-            hash_value = struct.unpack("<Q", file_handle.read(8))[0]
-            name_len = struct.unpack("<H", file_handle.read(2))[0]
-            raw_name = file_handle.read(name_len).rstrip(b'\x00')
-            name = raw_name.decode(self.ENCODING)
-            self.labels.append({"id": name, "hash": hash_value})
+            hash_value, name_len = unpack_header(buf, offset)
+            offset += header_size
+            raw_name = buf[offset:offset + name_len].rstrip(b'\x00')
+            offset += name_len
+            entries.append((raw_name.decode(encoding), hash_value))
+        return entries
 
     def read_until_null(self, file_handle: BinaryIO) -> str:
         """
@@ -96,6 +114,11 @@ class TblHandler:
             name_bytes.extend(byte)
         return name_bytes.decode(self.ENCODING)
 
+    @property
+    def labels(self) -> List[Dict[str, Any]]:
+        """Labels as a list of {"id", "hash"} dictionaries."""
+        return [{"id": name, "hash": hash_value} for name, hash_value in self._label_pairs]
+
     def get_labels(self) -> List[Dict[str, Any]]:
         """
         Get all labels from the .tbl file.
@@ -103,4 +126,25 @@ class TblHandler:
         Returns:
             List of dictionaries containing label information
         """
-        return self.labels
\ No newline at end of file
+        return self.labels
+
+    def get_label_pairs(self) -> Tuple[Tuple[str, int], ...]:
+        """
+        Get all labels without building a dictionary per entry.
+        
+        Returns:
+            Tuple of (id, hash) pairs
+        """
+        return self._label_pairs
+
+
+@functools.lru_cache(maxsize=1024)
+def _load_labels(tbl_path: str) -> Tuple[Tuple[str, int], ...]:
+    """
+    Parse a .tbl file into (id, hash) pairs.
+    
+    Cached per path, so a table shared by several .dat files is parsed once per process.
+    """
+    with open(tbl_path, "rb") as f:
+        TblHandler._validate_header(f)
+        return tuple(TblHandler._read_entries(f))
\ No newline at end of file
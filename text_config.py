@@ -1,6 +1,6 @@
 # text_config.py
 from collections import namedtuple
-from typing import Dict
+from typing import Dict, Optional
 
 # Defining the TextLine structure as a namedtuple
 TextLine = namedtuple('TextLine', ['offset', 'length', 'flags'])
@@ -131,9 +131,14 @@ class TextConfig:
         Raises:
             ValueError: If the game version is not supported.
         """
+        self.game_version = game_version
         self.variables: Dict[int, str] = self.get_variables(game_version)
         if not self.variables:
             raise ValueError(f"Game version '{game_version}' is not supported.")
+        # Reverse lookup (name -> code); the first code wins for duplicate names
+        self.variable_codes: Dict[str, int] = {}
+        for code, var_name in self.variables.items():
+            self.variable_codes.setdefault(var_name, code)
 
     def get_variables(self, game_version: str) -> Dict[int, str]:
         """
@@ -161,12 +166,24 @@ class TextConfig:
         """
         return self.variables.get(code, f"{code:04X}")
 
+    def get_variable_string_or_none(self, code: int) -> Optional[str]:
+        """
+        Returns the variable name for a given code, or None if it is not mapped.
+        
+        Args:
+            code (int): The variable code.
+        
+        Returns:
+            Optional[str]: The variable name, or None.
+        """
+        return self.variables.get(code)
+
     def get_variable_number(self, name: str) -> int:
         """
         Converts a variable name or hexadecimal string to its code (ushort).
         
-        Iterates through the mappings to find a match. If not found,
-        attempts to convert the string to an integer (supporting hexadecimal formats).
+        Looks the name up in the mappings. If not found, attempts to convert
+        the string to an integer (supporting hexadecimal formats).
         
         Args:
             name (str): The variable name or a string representing a number.
@@ -177,9 +194,9 @@ class TextConfig:
         Raises:
             ValueError: If the name does not correspond to a valid code.
         """
-        for code, var_name in self.variables.items():
-            if var_name == name:
-                return code
+        code = self.variable_codes.get(name)
+        if code is not None:
+            return code
         try:
             if name.startswith('0x'):
                 return int(name[2:], 16)
@@ -1,7 +1,9 @@
 # text_file.py
+import array
+import functools
 import struct
-from io import StringIO
-from typing import Iterable, List
+import sys
+from typing import Iterable, Iterator, List, Sequence
 
 from text_config import TextConfig, TextLine
 
@@ -15,6 +17,10 @@ CLEAR_TEXT_KEY = 0xBE01
 WAIT_TEXT_KEY = 0xBE02
 NULL_TEXT_KEY = 0xBDFF
 RUBY_TEXT_KEY = 0xFF01
+NEWLINE_KEY = 0x000A
+BACKSLASH_KEY = 0x005C
+OPEN_BRACKET_KEY = 0x005B
+OPEN_BRACE_KEY = 0x007B
 
 REMAP_CHAR_MAP = {
     0xE07F: 0x202F,
@@ -22,33 +28,112 @@ REMAP_CHAR_MAP = {
     0xE08E: 0x2642,
     0xE08F: 0x2640,
 }
+# REMAP_CHAR_MAP as a table over its key range, for a range check instead of a lookup
+REMAP_LOW, REMAP_HIGH = min(REMAP_CHAR_MAP), max(REMAP_CHAR_MAP)
+REMAP_TABLE = tuple(REMAP_CHAR_MAP.get(val, val) for val in range(REMAP_LOW, REMAP_HIGH + 1))
+
+# Characters written without escaping or a variable lookup (no game maps these
+# codes as variables): printable ASCII except '\\', '[' and '{', plus the
+# remapped characters when remapping is enabled
+PLAIN_ASCII = {val: chr(val) for val in range(0x20, 0x7F) if chr(val) not in '\\[{'}
+PLAIN_REMAPPED = {**PLAIN_ASCII, **{src: chr(dst) for src, dst in REMAP_CHAR_MAP.items()}}
+# Characters written as an escape sequence
+ESCAPED_CHARS = {
+    NEWLINE_KEY: '\\n',
+    BACKSLASH_KEY: '\\\\',
+    OPEN_BRACKET_KEY: '\\[',
+    OPEN_BRACE_KEY: '\\{',
+}
+# Every character with fixed text, looked up first by the line parser
+FIXED_ASCII = {**PLAIN_ASCII, **ESCAPED_CHARS}
+FIXED_REMAPPED = {**PLAIN_REMAPPED, **ESCAPED_CHARS}
+
+# Lines are decrypted together in blocks of about this many bytes; big enough to
+# amortize the per-line XOR overhead, small enough to stay cache-friendly
+DECRYPT_BLOCK_SIZE = 64 * 1024
+
+U16 = struct.Struct('<H')
+U32 = struct.Struct('<I')
+# TextSections, LineCount, TotalLength, InitialKey, SectionDataOffset
+HEADER = struct.Struct('<HHIII')
+# Offset, Length (in u16 values), Flags of each line
+LINE_INFO = struct.Struct('<iHH')
 
 # Default empty text file data (20 bytes)
 EMPTY_TEXT_FILE = bytearray([0x01, 0x00, 0x00, 0x00, 0x04, 0x00, 0x00, 0x00,
                             0x00, 0x00, 0x00, 0x00, 0x10, 0x00, 0x00, 0x00,
                             0x04, 0x00, 0x00, 0x00])
 
+# Unbounded on purpose: keys are u16, so there are at most 65536 cycles (about 10 MiB).
+# A smaller LRU is useless for files with more lines than it holds, since lines
+# are read in order and each key is evicted before the next file reuses it
+@functools.lru_cache(maxsize=None)
+def _key_cycle(key: int) -> bytes:
+    """
+    One period of the XOR keystream starting with key.
+
+    The key is rotated left by 3 bits after every u16, so the stream repeats
+    every 16 values (32 bytes). Line i always starts from the same key, so the
+    cycles are reused by every later file.
+    """
+    cycle = bytearray(32)
+    for i in range(0, 32, 2):
+        U16.pack_into(cycle, i, key)
+        key = ((key << 3) | (key >> 13)) & 0xFFFF
+    return bytes(cycle)
+
+def _u16_view(data) -> Sequence[int]:
+    """
+    View little-endian u16 data as a sequence of ints, without copying on
+    little-endian hosts. A trailing odd byte is not part of any value and is ignored.
+    """
+    view = memoryview(data)
+    if len(view) % 2:
+        view = view[:-1]
+    if sys.byteorder == 'little':
+        return view.cast('H')
+    values = array.array('H', view.tobytes())
+    values.byteswap()
+    return values
+
+def _keystream(key: int, length: int) -> bytes:
+    """Build the XOR keystream for a line starting with key, as length bytes."""
+    repeats = -(-length // 32)
+    return (_key_cycle(key) * repeats)[:length]
+
 class TextFile:
     """Class to handle Pokémon Switch game text binaries."""
     
     def decrypt_line(self, index: int) -> str:
         return self.get_line(index)
     
-    def __init__(self, data=None, config=None, remap_characters: bool = False):
-        """Initialize with binary data or default empty data."""
-        self.data = bytearray(data) if data is not None else bytearray(EMPTY_TEXT_FILE)
+    def __init__(self, data=None, config=None, remap_characters: bool = False, copy: bool = True):
+        """
+        Initialize with binary data or default empty data.
+
+        With copy=False the given buffer (bytes, mmap, ...) is used as-is, which
+        avoids duplicating the file for read-only access; setters then need a
+        writable buffer.
+        """
+        if data is None:
+            self.data = bytearray(EMPTY_TEXT_FILE)
+        else:
+            self.data = bytearray(data) if copy else data
         self.config = config or TextConfig("default")  # Replace "default" with actual game version
         self.remap_characters = remap_characters
         self.set_empty_text = False
-        self._cached_section_data_offset = None
         self._cached_line_offsets = None
         
-        # Validate initial conditions
-        if self.initial_key != 0:
+        # Validate initial conditions, reading the whole header at once
+        if len(self.data) < HEADER.size:
+            raise ValueError("Invalid text file format.")
+        text_sections, _, total_length, initial_key, sdo = HEADER.unpack_from(self.data, 0)
+        self._cached_section_data_offset = sdo
+        if initial_key != 0:
             raise ValueError("Invalid initial key! Expected 0.")
-        if self.section_data_offset + self.total_length != len(self.data) or self.text_sections != 1:
+        if sdo + total_length != len(self.data) or text_sections != 1:
             raise ValueError("Invalid text file format.")
-        if self.section_length != self.total_length:
+        if self.section_length != total_length:
             raise ValueError("Section length and total length mismatch.")
 
     @classmethod
@@ -62,93 +147,95 @@ class TextFile:
     # Properties to access/modify header fields
     @property
     def text_sections(self):
-        return struct.unpack_from('<H', self.data, 0x00)[0]
+        return U16.unpack_from(self.data, 0x00)[0]
     
     @text_sections.setter
     def text_sections(self, value):
-        struct.pack_into('<H', self.data, 0x00, value)
+        U16.pack_into(self.data, 0x00, value)
 
     @property
     def line_count(self):
-        return struct.unpack_from('<H', self.data, 0x02)[0]
+        return U16.unpack_from(self.data, 0x02)[0]
     
     @line_count.setter
     def line_count(self, value):
-        struct.pack_into('<H', self.data, 0x02, value)
+        U16.pack_into(self.data, 0x02, value)
 
     @property
     def total_length(self):
-        return struct.unpack_from('<I', self.data, 0x04)[0]
+        return U32.unpack_from(self.data, 0x04)[0]
     
     @total_length.setter
     def total_length(self, value):
-        struct.pack_into('<I', self.data, 0x04, value)
+        U32.pack_into(self.data, 0x04, value)
 
     @property
     def initial_key(self):
-        return struct.unpack_from('<I', self.data, 0x08)[0]
+        return U32.unpack_from(self.data, 0x08)[0]
     
     @initial_key.setter
     def initial_key(self, value):
-        struct.pack_into('<I', self.data, 0x08, value)
+        U32.pack_into(self.data, 0x08, value)
 
     @property
     def section_data_offset(self):
         if self._cached_section_data_offset is None:
-            self._cached_section_data_offset = struct.unpack_from('<I', self.data, 0x0C)[0]
+            self._cached_section_data_offset = U32.unpack_from(self.data, 0x0C)[0]
         return self._cached_section_data_offset
     
     @section_data_offset.setter
     def section_data_offset(self, value):
-        struct.pack_into('<I', self.data, 0x0C, value)
+        U32.pack_into(self.data, 0x0C, value)
         self._cached_section_data_offset = value
 
     @property
     def section_length(self):
-        return struct.unpack_from('<I', self.data, self.section_data_offset)[0]
+        return U32.unpack_from(self.data, self.section_data_offset)[0]
     
     @section_length.setter
     def section_length(self, value):
-        struct.pack_into('<I', self.data, self.section_data_offset, value)
+        U32.pack_into(self.data, self.section_data_offset, value)
 
     @property
     def line_offsets(self):
         """Get/set line offsets and metadata as a list of TextLine objects."""
         if self._cached_line_offsets is None:
-            result = []
             base = self.section_data_offset + 4  # After SectionLength
-            for i in range(self.line_count):
-                offset, length, flags = struct.unpack_from('<iHH', self.data, base + i * 8)
-                result.append(TextLine(offset, length, flags))
-            self._cached_line_offsets = result
+            end = base + self.line_count * LINE_INFO.size
+            if end > len(self.data):
+                raise struct.error(f"line offsets require a buffer of at least {end} bytes")
+            table = memoryview(self.data)[base:end]
+            self._cached_line_offsets = list(map(TextLine._make, LINE_INFO.iter_unpack(table)))
+            table.release()
         return self._cached_line_offsets
     
     @line_offsets.setter
     def line_offsets(self, value):
         base = self.section_data_offset + 4
+        pack_into = LINE_INFO.pack_into
+        data = self.data
         for i, line in enumerate(value):
-            struct.pack_into('<iHH', self.data, base + i * 8, line.offset, line.length, line.flags)
+            pack_into(data, base + i * 8, line.offset, line.length, line.flags)
         self._cached_line_offsets = value
 
     @property
     def lines(self):
         """Get text lines as a list of strings."""
-        key = BASE_KEY
-        result = []
-        for line in self.line_offsets:
-            start = self.section_data_offset + line.offset
-            end = start + line.length * 2
-            encrypted = self.data[start:end]
-            decrypted = self.encrypt_line_data(encrypted, key)
-            result.append(self.parse_line_string(decrypted))
-            key = (key + ADVANCE_KEY) & 0xFFFF
-        return result
+        return list(self.iter_lines())
 
     @lines.setter
     def lines(self, value):
         line_data = self.convert_lines_to_data(value)
         self.line_data = line_data
 
+    def iter_lines(self) -> Iterator[str]:
+        """Yield text lines one at a time, decrypting only a block of lines at once."""
+        spans = self._line_spans()
+        keys = [(BASE_KEY + i * ADVANCE_KEY) & 0xFFFF for i in range(len(spans))]
+        parse_line_string = self.parse_line_string
+        for decrypted in self._decrypt_spans(spans, keys):
+            yield parse_line_string(decrypted)
+
     @property
     def flags(self):
         """Get/set flags for each line."""
@@ -156,49 +243,102 @@ class TextFile:
     
     @flags.setter
     def flags(self, value):
+        # Only the Flags field of changed entries is written back
         offsets = self.line_offsets
-        offsets = [offsets[i]._replace(flags=flag) for i, flag in enumerate(value)]
-        self.line_offsets = offsets
+        base = self.section_data_offset + 4 + 6  # Flags of the first entry
+        pack_into = U16.pack_into
+        data = self.data
+        result = []
+        for i, flag in enumerate(value):
+            line = offsets[i]
+            if line.flags != flag:
+                pack_into(data, base + i * 8, flag)
+                line = line._replace(flags=flag)
+            result.append(line)
+        self._cached_line_offsets = result
 
     @property
     def line_data(self):
         """Get/set encrypted line data as a list of bytearrays."""
-        result = []
-        lines = self.line_offsets
-        sdo = self.section_data_offset
+        spans = self._line_spans()
+        keys = []
         key = BASE_KEY
-        for line in lines:
-            start = sdo + line.offset
-            end = start + line.length * 2
-            encrypted = self.data[start:end]
-            decrypted = self.encrypt_line_data(encrypted, key)
-            result.append(decrypted)
+        for _ in spans:
+            keys.append(key)
             key = ((key << 3) | (key >> 13)) & 0xFFFF
-        return result
+        return [bytearray(decrypted) for decrypted in self._decrypt_spans(spans, keys)]
     
     @line_data.setter
     def line_data(self, value):
-        # Calculate total size and rebuild offsets
-        lines = [TextLine(0, len(v) // 2, 0) for v in value]  # Temporary offsets
-        bytes_used = 4 + len(value) * 8  # SectionLength + LineOffsets
-        for i, v in enumerate(value):
-            lines[i] = lines[i]._replace(offset=bytes_used)
+        # Calculate total size and lay out the lines after the offset table
+        lines = []
+        bytes_used = 4 + len(value) * LINE_INFO.size  # SectionLength + LineOffsets
+        for v in value:
+            lines.append(TextLine(bytes_used, len(v) // 2, 0))
             bytes_used += len(v)
             if bytes_used % 4 == 2:  # 4-byte alignment padding
                 bytes_used += 2
         
         # Resize data and set values
         sdo = self.section_data_offset
-        self.data = self.data[:sdo] + bytearray(bytes_used)
+        if isinstance(self.data, bytearray):
+            self.data[sdo:] = bytes(bytes_used)  # Resized in place
+        else:  # Read-only buffer (copy=False): switch to an owned copy
+            self.data = bytearray(self.data[:sdo]) + bytearray(bytes_used)
         self.section_length = bytes_used
         self.total_length = bytes_used
         self.line_count = len(value)
-        self.line_offsets = lines
         
-        # Copy encrypted data
-        for i, encrypted in enumerate(value):
-            start = sdo + lines[i].offset
-            self.data[start:start + len(encrypted)] = encrypted
+        # Write each line's offset entry and encrypted data in a single pass
+        data = self.data
+        base = sdo + 4
+        pack_into = LINE_INFO.pack_into
+        for i, (line, encrypted) in enumerate(zip(lines, value)):
+            pack_into(data, base + i * LINE_INFO.size, *line)
+            start = sdo + line.offset
+            data[start:start + len(encrypted)] = encrypted
+        self._cached_line_offsets = lines
+
+    def _line_spans(self) -> List[tuple[int, int]]:
+        """(start, size in bytes) of every line's data within the file."""
+        sdo = self.section_data_offset
+        return [(sdo + line.offset, line.length * 2) for line in self.line_offsets]
+
+    def _decrypt_spans(self, spans: List[tuple[int, int]], keys: List[int]) -> Iterator[bytes]:
+        """
+        Decrypt each (start, size) span of the data with its key, in order.
+
+        When the spans are in order, non-overlapping and inside the data (as in
+        every well-formed file), consecutive lines are XORed together in blocks
+        of about DECRYPT_BLOCK_SIZE bytes; otherwise each span is decrypted on its own.
+        """
+        data = self.data
+        in_order = all(start + size <= next_start
+                       for (start, size), (next_start, _) in zip(spans, spans[1:]))
+        if not spans or not in_order or spans[0][0] < 0 or sum(spans[-1]) > len(data):
+            for (start, size), key in zip(spans, keys):
+                yield self.encrypt_line_data(data[start:start + size], key)
+            return
+
+        count = len(spans)
+        first = 0
+        while first < count:
+            # Lay out the keystreams of the next block of lines, zero-filling the padding
+            begin = pos = spans[first][0]
+            last = first
+            streams = []
+            while last < count and pos - begin < DECRYPT_BLOCK_SIZE:
+                start, size = spans[last]
+                if start > pos:
+                    streams.append(bytes(start - pos))
+                streams.append(_keystream(keys[last], size))
+                pos = start + size
+                last += 1
+            plain = (int.from_bytes(data[begin:pos], 'little')
+                     ^ int.from_bytes(b''.join(streams), 'little')).to_bytes(pos - begin, 'little')
+            for start, size in spans[first:last]:
+                yield plain[start - begin:start - begin + size]
+            first = last
 
     def get_encrypted_line(self, index):
         """Get encrypted byte data for a specific line."""
@@ -220,50 +360,65 @@ class TextFile:
 
     def encrypt_line_data(self, data: bytes | bytearray, key: int) -> bytearray:
         """Encrypt/decrypt line data using XOR (symmetric operation)."""
-        result = bytearray(data)
-        key_mask = 0xFFFF
-        for i in range(0, len(result), 2):
-            u16 = struct.unpack_from('<H', result, i)[0]
-            u16 ^= key
-            struct.pack_into('<H', result, i, u16)
-            key = ((key << 3) | (key >> 13)) & key_mask
-        return result
+        length = len(data)
+        if length % 2:
+            raise ValueError("Line data must be a whole number of 16-bit values.")
+        # XOR the whole line at once as one little-endian integer
+        stream = _keystream(key, length)
+        value = int.from_bytes(data, 'little') ^ int.from_bytes(stream, 'little')
+        return bytearray(value.to_bytes(length, 'little'))
 
     def parse_line_string(self, data: bytes | bytearray) -> str:
         """Convert decrypted byte data into a readable string."""
-        s = StringIO()
-        i = 0
-        while i < len(data):
-            val = struct.unpack_from('<H', data, i)[0]
-            i += 2
-            if val == TERMINATOR_KEY:
+        return self._parse_values(_u16_view(data))
+
+    def parse_variable_string(self, data: bytes | bytearray, start: int) -> tuple[str, int]:
+        """Process variable data and return string representation with bytes consumed."""
+        text, consumed = self._parse_variable_values(_u16_view(data), start // 2)
+        return text, consumed * 2
+
+    def _parse_values(self, values: Sequence[int], start: int = 0, end: int | None = None) -> str:
+        """Convert decrypted u16 values in values[start:end] into a readable string."""
+        parts = []
+        # Bound once; these run for every character
+        append = parts.append
+        variable_name = self.config.get_variable_string_or_none
+        parse_variable = self._parse_variable_values
+        fixed = (FIXED_REMAPPED if self.remap_characters else FIXED_ASCII).get
+        length = len(values) if end is None else min(end, len(values))
+        i = start
+        while i < length:
+            val = values[i]
+            i += 1
+            text = fixed(val)
+            if text is not None:
+                append(text)
+            elif val == TERMINATOR_KEY:
                 break
             elif val == VARIABLE_KEY:
-                var_str, consumed = self.parse_variable_string(data, i)
-                s.write(var_str)
+                var_str, consumed = parse_variable(values, i, length)
+                append(var_str)
                 i += consumed
-            elif val == 0x0A:  # '\n'
-                s.write('\\n')
-            elif val == ord('\\'):
-                s.write('\\\\')
-            elif val == ord('['):
-                s.write('\\[')
-            elif val == ord('{'):
-                s.write('\\{')
             else:
-                mapped = self.config.get_variable_string(val)
-                if mapped != f"{val:04X}":
-                    s.write(mapped)
+                mapped = variable_name(val)
+                if mapped is not None:
+                    append(mapped)
                 else:
-                    s.write(chr(self.try_remap_character(val)))
-        return s.getvalue()
+                    append(chr(val))
+        return ''.join(parts)
 
-    def parse_variable_string(self, data: bytes | bytearray, start: int) -> tuple[str, int]:
-        """Process variable data and return string representation with bytes consumed."""
+    def _parse_variable_values(self, values: Sequence[int], start: int,
+                               end: int | None = None) -> tuple[str, int]:
+        """
+        Process variable u16 values and return string representation with values consumed.
+
+        Values at or past end are not read; a variable running into them raises IndexError.
+        """
+        if end is not None and end < len(values):
+            values = values[:end]
         i = start
-        count = struct.unpack_from('<H', data, i)[0]
-        i += 2
-        variable = struct.unpack_from('<H', data, i)[0]
+        count = values[i]
+        variable = values[i + 1]
         i += 2
 
         if variable == RETURN_TEXT_KEY:
@@ -271,27 +426,26 @@ class TextFile:
         elif variable == CLEAR_TEXT_KEY:
             return "\\c", i - start
         elif variable == WAIT_TEXT_KEY:
-            time = struct.unpack_from('<H', data, i)[0]
-            i += 2
+            time = values[i]
+            i += 1
             return f"[WAIT {time}]", i - start
         elif variable == NULL_TEXT_KEY:
-            line = struct.unpack_from('<H', data, i)[0]
-            i += 2
+            line = values[i]
+            i += 1
             return f"[~ {line}]", i - start
         elif variable == RUBY_TEXT_KEY:
-            base_len = struct.unpack_from('<H', data, i)[0]
-            i += 2
-            ruby_len = struct.unpack_from('<H', data, i)[0]
+            base_len = values[i]
+            ruby_len = values[i + 1]
             i += 2
-            base1 = data[i:i + base_len * 2]
-            i += base_len * 2
-            ruby = data[i:i + ruby_len * 2]
-            i += ruby_len * 2
-            base2 = data[i:i + base_len * 2]
-            i += base_len * 2
-            s = ['{', self.parse_line_string(base1), '|', self.parse_line_string(ruby)]
-            if base1 != base2:
-                s.extend(['|', self.parse_line_string(base2)])
+            # The three parts are parsed in place, as bounds into values
+            base1 = i
+            ruby = base1 + base_len
+            base2 = ruby + ruby_len
+            i = base2 + base_len
+            parse_values = self._parse_values
+            s = ['{', parse_values(values, base1, ruby), '|', parse_values(values, ruby, base2)]
+            if values[base1:ruby] != values[base2:i]:
+                s.extend(['|', parse_values(values, base2, i)])
             s.append('}')
             return ''.join(s), i - start
         else:
@@ -299,11 +453,10 @@ class TextFile:
             s = [f"[VAR {var_name}"]
             if count > 1:
                 s.append('(')
-                args = []
-                for _ in range(count - 1):
-                    arg = struct.unpack_from('<H', data, i)[0]
-                    i += 2
-                    args.append(f"{arg:04X}")
+                args = [f"{arg:04X}" for arg in values[i:i + count - 1]]
+                if len(args) < count - 1:
+                    raise IndexError("Variable arguments past the end of the line")
+                i += count - 1
                 s.append(','.join(args))
                 s.append(')')
             s.append(']')
@@ -311,14 +464,16 @@ class TextFile:
 
     def try_remap_character(self, val: int) -> int:
         """Remap special characters to Unicode equivalents if remap_characters is True."""
-        if not self.remap_characters:
+        if not self.remap_characters or not REMAP_LOW <= val <= REMAP_HIGH:
             return val
-        return REMAP_CHAR_MAP.get(val, val)
+        return REMAP_TABLE[val - REMAP_LOW]
 
     def convert_lines_to_data(self, lines: Iterable[str]) -> List[bytearray]:
         """Convert a list of strings into encrypted line data."""
         key = BASE_KEY
         result = []
+        to_line_data = self.string_to_line_data
+        encrypt = self.encrypt_line_data
         for i, text in enumerate(lines):
             if text is None:
                 text = ''
@@ -326,17 +481,20 @@ class TextFile:
                 text = text.strip()
             if not text and self.set_empty_text:
                 text = f"[~ {i}]"
-            decrypted = self.string_to_line_data(text)
-            encrypted = self.encrypt_line_data(decrypted, key)
-            result.append(encrypted)
+            result.append(encrypt(to_line_data(text), key))
             key = (key + ADVANCE_KEY) & 0xFFFF
         return result
 
     def string_to_line_data(self, line: str) -> bytes:
         """Convert a string into decrypted bytearray."""
         result = []
+        append = result.append
+        extend = result.extend
+        variable_code = self.config.variable_codes.get
+        remap = self.remap_characters
+        length = len(line)
         i = 0
-        while i < len(line):
+        while i < length:
             c = line[i]
             i += 1
             if c == '[':
@@ -344,38 +502,38 @@ class TextFile:
                 if end < 0:
                     raise ValueError("Unterminated variable text")
                 var_text = line[i:end]
-                result.extend(self.parse_variable_values(var_text))
+                extend(self.parse_variable_values(var_text))
                 i = end + 1
             elif c == '{':
                 end = line.find('}', i)
                 if end < 0:
                     raise ValueError("Unterminated ruby text")
                 ruby_text = line[i:end]
-                result.extend(self.parse_ruby_values(ruby_text))
+                extend(self.parse_ruby_values(ruby_text))
                 i = end + 1
             elif c == '\\':
-                result.extend(self.parse_escape_values(line[i]))
+                extend(self.parse_escape_values(line[i]))
                 i += 1
             else:
                 # Checks if the character is mapped as a variable
-                for code, var_str in self.config.variables.items():
-                    if var_str == c:  # Ex.: "₽" mapeado para 0xE300
-                        result.append(code)
-                        break
+                code = variable_code(c)  # Ex.: "₽" mapeado para 0xE300
+                if code is not None:
+                    append(code)
                 else:  # If it is not a variable, treat it as a normal character.
                     val = ord(c)
-                    val = self.try_remap_character(val)
-                    result.append(val)
+                    if remap and REMAP_LOW <= val <= REMAP_HIGH:
+                        val = REMAP_TABLE[val - REMAP_LOW]
+                    append(val)
         result.append(TERMINATOR_KEY)
-        return struct.pack('<' + 'H' * len(result), *result)
+        return struct.pack(f'<{len(result)}H', *result)
 
     def parse_escape_values(self, esc: str) -> List[int]:
         """Convert escape sequences into their ushort values."""
         ESC_MAP = {
-            'n': [0x0A],
-            '\\': [ord('\\')],
-            '[': [ord('[')],
-            '{': [ord('{')],
+            'n': [NEWLINE_KEY],
+            '\\': [BACKSLASH_KEY],
+            '[': [OPEN_BRACKET_KEY],
+            '{': [OPEN_BRACE_KEY],
             'r': [VARIABLE_KEY, 1, RETURN_TEXT_KEY],
             'c': [VARIABLE_KEY, 1, CLEAR_TEXT_KEY]
         }
@@ -14,7 +14,7 @@ def get_strings(data: bytes, config=None, remap_characters: bool = False) -> Opt
     Extract strings from binary data.
     
     Args:
-        data (bytes): Binary data to extract strings from
+        data (bytes-like): Binary data to extract strings from (bytes, bytearray, mmap, ...)
         config (dict, optional): Configuration parameters for text extraction
         remap_characters (bool, optional): Whether to apply character remapping
         
@@ -22,7 +22,8 @@ def get_strings(data: bytes, config=None, remap_characters: bool = False) -> Opt
         list: Extracted text lines or None if extraction fails
     """
     try:
-        return TextFile(data, config, remap_characters).lines
+        # Only read from, so decode straight from the caller's buffer
+        return TextFile(data, config, remap_characters, copy=False).lines
     except Exception:
         return None
 
@@ -40,4 +41,20 @@ def get_bytes(lines: Iterable[str], flags: Iterable[int], config=None, remap_cha
     Returns:
         bytes: Binary representation of the text
     """
-    return bytes(TextFile.from_lines(lines, flags, config, remap_characters).data)
\ No newline at end of file
+    return bytes(get_bytearray(lines, flags, config, remap_characters))
+
+
+def get_bytearray(lines: Iterable[str], flags: Iterable[int], config=None, remap_characters: bool = False) -> bytearray:
+    """
+    Convert lines and flags to binary data, without copying it into a new bytes object.
+    
+    Args:
+        lines (list): List of text strings
+        flags (list): Associated flags for each line
+        config (dict, optional): Configuration parameters for text conversion
+        remap_characters (bool, optional): Whether to apply character remapping
+        
+    Returns:
+        bytearray: The encoder's own buffer, e.g. for writing straight to a file
+    """
+    return TextFile.from_lines(lines, flags, config, remap_characters).data